@@ -18,11 +18,18 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import io
 import json
-from collections import Counter
+import os
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timedelta
 import altair as alt
+import pyarrow as pa
+from pyarrow import compute as pc
+from pyarrow import csv as pa_csv
+import pyarrow.parquet as pq
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -40,76 +47,75 @@ st.set_page_config(
 if 'theme' not in st.session_state:
     st.session_state.theme = 'light'
 
+# BPCL Enterprise color palettes, built once at import (read-only views)
+DARK_THEME_COLORS = MappingProxyType({
+    # BPCL Dark Theme - Deep Navy Base
+    'bg': '#0f1419',              # Deep charcoal navy (page background)
+    'secondary_bg': '#1a2332',    # Elevated navy (sidebar, elevated sections)
+    'card_bg': '#212d3d',         # Card background with depth
+    'card_hover': '#263447',      # Card hover state
+    
+    # Text Hierarchy
+    'text': '#f0f3f7',            # Primary text - high contrast white
+    'text_bright': '#ffffff',     # KPI values - brightest
+    'secondary_text': '#8a98ab',  # Labels and secondary info
+    'tertiary_text': '#5e6c7f',   # Captions and hints
+    
+    # BPCL Brand Accents
+    'primary': '#1e88e5',         # Petroleum blue (BPCL primary)
+    'primary_glow': 'rgba(30, 136, 229, 0.25)',
+    'accent_green': '#00c853',    # Energy green (success, positive)
+    'accent_orange': '#ff6f00',   # Petroleum orange (warnings, highlights)
+    
+    # Sentiment Colors (Energy industry)
+    'positive': '#00c853',        # Energy green
+    'negative': '#ff3d00',        # Alert red
+    'neutral': '#ffa726',         # Amber
+    
+    # UI Elements
+    'border': 'rgba(138, 152, 171, 0.15)',
+    'border_bright': 'rgba(30, 136, 229, 0.4)',
+    'divider': 'rgba(138, 152, 171, 0.1)',
+    
+    # Chart Styling
+    'plot_bg': '#1a2332',
+    'grid': 'rgba(138, 152, 171, 0.08)',
+    'grid_major': 'rgba(138, 152, 171, 0.12)'
+})
+
+LIGHT_THEME_COLORS = MappingProxyType({
+    'bg': '#ffffff',
+    'secondary_bg': '#f8f9fa',
+    'text': '#1f2937',
+    'text_bright': '#111827',
+    'secondary_text': '#6b7280',
+    'tertiary_text': '#9ca3af',
+    'plot_bg': '#ffffff',
+    'grid': 'rgba(107, 114, 128, 0.2)',
+    'grid_major': 'rgba(107, 114, 128, 0.3)',
+    'positive': '#10b981',
+    'negative': '#ef4444',
+    'neutral': '#f59e0b',
+    'primary': '#1e88e5',
+    'accent_green': '#10b981',
+    'accent_orange': '#f59e0b',
+    'border': 'rgba(229, 231, 235, 1)',
+    'card_bg': '#ffffff',
+    'card_hover': '#f9fafb',
+    'divider': 'rgba(229, 231, 235, 0.8)',
+    'primary_glow': 'rgba(30, 136, 229, 0.15)',
+    'border_bright': 'rgba(30, 136, 229, 0.3)'
+})
+
 def get_theme_colors():
     """Get colors based on current theme - BPCL Enterprise color palette"""
     if st.session_state.theme == 'dark':
-        return {
-            # BPCL Dark Theme - Deep Navy Base
-            'bg': '#0f1419',              # Deep charcoal navy (page background)
-            'secondary_bg': '#1a2332',    # Elevated navy (sidebar, elevated sections)
-            'card_bg': '#212d3d',         # Card background with depth
-            'card_hover': '#263447',      # Card hover state
-            
-            # Text Hierarchy
-            'text': '#f0f3f7',            # Primary text - high contrast white
-            'text_bright': '#ffffff',     # KPI values - brightest
-            'secondary_text': '#8a98ab',  # Labels and secondary info
-            'tertiary_text': '#5e6c7f',   # Captions and hints
-            
-            # BPCL Brand Accents
-            'primary': '#1e88e5',         # Petroleum blue (BPCL primary)
-            'primary_glow': 'rgba(30, 136, 229, 0.25)',
-            'accent_green': '#00c853',    # Energy green (success, positive)
-            'accent_orange': '#ff6f00',   # Petroleum orange (warnings, highlights)
-            
-            # Sentiment Colors (Energy industry)
-            'positive': '#00c853',        # Energy green
-            'negative': '#ff3d00',        # Alert red
-            'neutral': '#ffa726',         # Amber
-            
-            # UI Elements
-            'border': 'rgba(138, 152, 171, 0.15)',
-            'border_bright': 'rgba(30, 136, 229, 0.4)',
-            'divider': 'rgba(138, 152, 171, 0.1)',
-            
-            # Chart Styling
-            'plot_bg': '#1a2332',
-            'grid': 'rgba(138, 152, 171, 0.08)',
-            'grid_major': 'rgba(138, 152, 171, 0.12)'
-        }
-    else:
-        return {
-            'bg': '#ffffff',
-            'secondary_bg': '#f8f9fa',
-            'text': '#1f2937',
-            'text_bright': '#111827',
-            'secondary_text': '#6b7280',
-            'tertiary_text': '#9ca3af',
-            'plot_bg': '#ffffff',
-            'grid': 'rgba(107, 114, 128, 0.2)',
-            'grid_major': 'rgba(107, 114, 128, 0.3)',
-            'positive': '#10b981',
-            'negative': '#ef4444',
-            'neutral': '#f59e0b',
-            'primary': '#1e88e5',
-            'accent_green': '#10b981',
-            'accent_orange': '#f59e0b',
-            'border': 'rgba(229, 231, 235, 1)',
-            'card_bg': '#ffffff',
-            'card_hover': '#f9fafb',
-            'divider': 'rgba(229, 231, 235, 0.8)',
-            'primary_glow': 'rgba(30, 136, 229, 0.15)',
-            'border_bright': 'rgba(30, 136, 229, 0.3)'
-        }
+        return DARK_THEME_COLORS
+    return LIGHT_THEME_COLORS
 
-def apply_theme_css():
-    """Apply BPCL Enterprise Dark Theme CSS"""
-    theme_colors = get_theme_colors()
-    is_dark = st.session_state.theme == 'dark'
-    
-    # BPCL Dark Theme CSS
-    if is_dark:
-        st.markdown(f"""
+def build_dark_theme_css(theme_colors):
+    """Build the BPCL Enterprise Dark Theme CSS for a color palette"""
+    return f"""
         <style>
             /* ============================================
                BPCL ENTERPRISE DARK THEME
@@ -449,10 +455,12 @@ def apply_theme_css():
                 font-size: 0.85rem !important;
             }}
         </style>
-        """, unsafe_allow_html=True)
-    else:
-        # Light theme - minimal styling
-        st.markdown("""
+        """
+
+# Both stylesheets are constant, so build them once at import
+DARK_THEME_CSS = build_dark_theme_css(DARK_THEME_COLORS)
+
+LIGHT_THEME_CSS = """
         <style>
             .main-header {{
                 font-size: 2.5rem;
@@ -494,48 +502,163 @@ def apply_theme_css():
                 border-color: rgba(200, 200, 200, 0.2);
             }}
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+def apply_theme_css():
+    """Apply BPCL Enterprise Dark Theme CSS"""
+    # Emit on every rerun: Streamlit drops elements a run does not re-create,
+    # so skipping an "already injected" theme would strip the styling
+    is_dark = st.session_state.theme == 'dark'
+    st.html(DARK_THEME_CSS if is_dark else LIGHT_THEME_CSS)
 
 apply_theme_css()
 
 # =============================================================================
 # DATA LOADING & CACHING
 # =============================================================================
+# Columns of the enriched dataset used by the dashboard (reviewId keeps exports traceable).
+# Review text is loaded separately by load_review_text()
+DATA_COLUMNS = ['reviewId', 'score', 'at', 'appVersion', 'Topic_Label', 'ai_sentiment',
+                'ai_confidence', 'sentiment_score', 'month_year', 'year', 'month', 'week', '_tokens']
+
+# Columns read from disk; dominant_topic is only needed when Topic_Label is missing
+SOURCE_COLUMNS = ['reviewId', 'score', 'at', 'appVersion', 'Topic_Label',
+                  'dominant_topic', 'ai_sentiment', 'ai_confidence', 'sentiment_score']
+
+def read_enriched_csv(path, columns):
+    """Read the enriched CSV with the multi-threaded PyArrow parser and explicit types"""
+    header = pd.read_csv(path, nrows=0).columns
+    table = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=[col for col in columns if col in header],
+            strings_can_be_null=True,
+            column_types={'at': pa.timestamp('s'), 'appVersion': pa.string()}
+        )
+    )
+    return table.to_pandas()
+
+def read_enriched_parquet(path, columns):
+    """Read only the requested columns from the Parquet copy"""
+    names = pq.read_schema(path).names
+    return pd.read_parquet(path, columns=[col for col in columns if col in names])
+
+def read_enriched(path, columns):
+    """Read columns of the enriched dataset from its Parquet or CSV file"""
+    if path.endswith('.parquet'):
+        return read_enriched_parquet(path, columns)
+    return read_enriched_csv(path, columns)
+
+def file_stat(path):
+    """os.stat() of path, or None when the file does not exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def data_file_signature():
+    """Pick the enriched data file and return (path, mtime, size)
+    
+    Passed to load_data() and the filter caches so their entries are keyed to
+    the file version and a replaced file takes effect on the next run.
+    """
+    csv_path, parquet_path = 'df_final_enriched.csv', 'df_final_enriched.parquet'
+    csv_stat, parquet_stat = file_stat(csv_path), file_stat(parquet_path)
+    
+    # Prefer the typed Parquet copy (see convert_to_parquet.py), but only while
+    # it is at least as new as the CSV it was built from
+    if parquet_stat is not None and (csv_stat is None or parquet_stat.st_mtime_ns >= csv_stat.st_mtime_ns):
+        path, stat = parquet_path, parquet_stat
+    else:
+        path, stat = csv_path, csv_stat
+    
+    if stat is None:
+        return path, None, None
+    return path, stat.st_mtime_ns, stat.st_size
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_review_text(signature):
+    """Load the review text column, aligned with the rows of load_data()
+    
+    The text is most of the dataset's size but only search, the explorer
+    table and exports read it, so it is kept out of the pickled load_data()
+    and apply_filters() results and shared read-only instead.
+    """
+    try:
+        df = read_enriched(signature[0], ['content'])
+    except FileNotFoundError:
+        return None
+    if 'content' not in df.columns:
+        return None
+    # Arrow-backed strings give .str.contains/.str.lower C kernels on pandas < 3 too
+    return df['content'].astype('string[pyarrow]')
+
 @st.cache_data
-def load_data():
+def load_data(signature):
     """Load the enriched dataset with sentiment and topic labels"""
+    path = signature[0]
     try:
-        df = pd.read_csv('df_final_enriched.csv')
+        df = read_enriched(path, SOURCE_COLUMNS)
         
         # Parse dates
         if 'at' in df.columns:
-            df['at'] = pd.to_datetime(df['at'], errors='coerce')
-            df['month_year'] = df['at'].dt.to_period('M').astype(str)
+            if not pd.api.types.is_datetime64_any_dtype(df['at']):
+                df['at'] = pd.to_datetime(df['at'], errors='coerce')
+            # Format each distinct month once instead of once per row
+            month_codes, months = pd.factorize(df['at'].dt.to_period('M'))
+            df['month_year'] = pd.Categorical.from_codes(month_codes, months.astype(str))
             df['year'] = df['at'].dt.year
             df['month'] = df['at'].dt.month
-            df['week'] = df['at'].dt.isocalendar().week
+            # ISO weeks fit in a byte; isocalendar() hands back nullable UInt32
+            df['week'] = df['at'].dt.isocalendar().week.astype('UInt8')
         
         # Ensure required columns exist
         if 'Topic_Label' not in df.columns and 'dominant_topic' in df.columns:
-            df['Topic_Label'] = 'Topic ' + (df['dominant_topic'] + 1).astype(str)
+            # Build one label per distinct topic id, stored as category codes
+            topic_codes, topic_ids = pd.factorize(df['dominant_topic'], sort=True)
+            topic_labels = 'Topic ' + (pd.Series(topic_ids) + 1).astype(str)
+            df['Topic_Label'] = pd.Categorical.from_codes(topic_codes, topic_labels)
+        
+        review_text = load_review_text(signature)
+        if review_text is not None:
+            # Tokenize once so keyword charts only need to count
+            df['_tokens'] = tokenize_keywords(review_text)
+        
+        # Low-cardinality labels are filtered and grouped on every page
+        for col in ('ai_sentiment', 'Topic_Label', 'appVersion'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Keep version categories in release order for the sidebar
+        if 'appVersion' in df.columns:
+            versions = df['appVersion'].cat.categories
+            df['appVersion'] = df['appVersion'].cat.reorder_categories(
+                sorted(versions, key=version_sort_key))
+        
+        # Drop unused columns so every filter pass and cache copy moves less data
+        df = df[[col for col in DATA_COLUMNS if col in df.columns]]
+        
+        # Ratings, scores and date parts don't need 64-bit storage
+        df = df.assign(
+            **{col: pd.to_numeric(df[col], downcast='integer')
+               for col in df.select_dtypes(include='integer').columns},
+            **{col: pd.to_numeric(df[col], downcast='float')
+               for col in df.select_dtypes(include='float').columns},
+        )
         
         return df
     except FileNotFoundError:
-        st.error("⚠️ Data file 'df_final_enriched.csv' not found.")
-        return None
-
-@st.cache_data
-def load_confusion_matrix():
-    """Load confusion matrix data from sentiment analysis"""
-    try:
-        with open('confusion_matrix_data.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
+        st.error(f"⚠️ Data file '{path}' not found.")
         return None
 
-@st.cache_data
+@st.cache_resource
 def load_topic_keywords():
-    """Load topic keyword mappings"""
+    """Load topic keyword mappings
+    
+    Cached as a shared resource (no per-call copy), so the mapping is returned
+    read-only with tuple values.
+    """
     default_keywords = {
         "1": ["login", "app", "open", "otp", "verification"],
         "2": ["payment", "transaction", "money", "account", "bank"],
@@ -545,52 +668,126 @@ def load_topic_keywords():
     try:
         with open('topic_keywords.json', 'r') as f:
             data = json.load(f)
-            return data.get('negative_topics', default_keywords)
+            keywords = data.get('negative_topics', default_keywords)
     except FileNotFoundError:
-        return default_keywords
+        keywords = default_keywords
+    return MappingProxyType({topic: tuple(words) for topic, words in keywords.items()})
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
+def observed_categories(series):
+    """Categories present in a categorical Series, in category order"""
+    codes = np.unique(series.cat.codes.to_numpy())
+    return series.cat.categories[codes[codes >= 0]].tolist()
+
+def version_sort_key(version):
+    """Sort key for dotted app versions, e.g. '4.0.82' -> (4, 0, 82)"""
+    return tuple(int(p) if p.isdigit() else 0 for p in str(version).split('.'))
+
+TOPIC_NUMBER_RE = re.compile(r'(\d+)')
+
+@lru_cache(maxsize=None)
+def extract_topic_number(topic_label):
+    """Extract the leading topic number from a label such as 'Topic 1.0'"""
+    match = TOPIC_NUMBER_RE.search(topic_label)
+    return match.group(1) if match else None
+
 def format_topic_label(topic_label, topic_keywords):
     """Format topic label with keywords"""
     if not topic_label or pd.isna(topic_label):
         return "Unknown"
     
-    match = re.search(r'(\d+)', str(topic_label))
-    if match:
-        topic_num = match.group(1)
-        if topic_num in topic_keywords:
-            keywords = ', '.join(topic_keywords[topic_num][:3])
-            return f"Topic {topic_num} ({keywords}...)"
+    topic_num = extract_topic_number(str(topic_label))
+    if topic_num is not None and topic_num in topic_keywords:
+        keywords = ', '.join(topic_keywords[topic_num][:3])
+        return f"Topic {topic_num} ({keywords}...)"
     
     return str(topic_label)
 
-def get_top_keywords(texts, n=10):
-    """Extract top keywords from texts"""
-    stop_words = {'the', 'a', 'an', 'is', 'it', 'to', 'and', 'of', 'for', 'in', 'on', 'with', 
-                  'this', 'that', 'app', 'i', 'my', 'me', 'not', 'very', 'good', 'bad', 'nice',
-                  'like', 'just', 'now', 'would', 'could', 'get', 'go', 'want', 'see', 'use'}
-    
-    all_words = []
-    for text in texts:
-        if pd.notna(text):
-            words = re.findall(r'\b[a-z]{3,}\b', str(text).lower())
-            all_words.extend([w for w in words if w not in stop_words])
+STOP_WORDS = frozenset({'the', 'a', 'an', 'is', 'it', 'to', 'and', 'of', 'for', 'in', 'on', 'with', 
+                        'this', 'that', 'app', 'i', 'my', 'me', 'not', 'very', 'good', 'bad', 'nice',
+                        'like', 'just', 'now', 'would', 'could', 'get', 'go', 'want', 'see', 'use'})
+KEYWORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+def tokenize_keywords(texts):
+    """Tokenize texts into space-joined keyword strings with stop words removed"""
+    tokens = texts.fillna('').astype(str).str.lower().str.findall(KEYWORD_RE)
+    return tokens.map(lambda words: ' '.join(w for w in words if w not in STOP_WORDS))
+
+def get_top_keywords(tokens, n=10):
+    """Extract top keywords from pre-tokenized keyword strings (see tokenize_keywords)"""
+    # Split and count in PyArrow; rows without keywords split into a single ''
+    words = pc.split_pattern(pa.array(tokens, type=pa.string()), ' ').flatten()
+    word_counts = pc.value_counts(pc.filter(words, pc.not_equal(words, '')))
+    # Stable sort keeps first-seen order among ties, like Counter.most_common
+    top = pc.array_sort_indices(word_counts.field('counts'), order='descending')[:n]
+    return list(zip(word_counts.field('values').take(top).to_pylist(),
+                    word_counts.field('counts').take(top).to_pylist()))
+
+TIMELINE_MAX_POINTS = 400
+
+def get_timeline_frequency(start, end):
+    """Pick the finest date bucket that keeps each timeline series under TIMELINE_MAX_POINTS"""
+    span_days = (end - start).days if pd.notna(start) and pd.notna(end) else 0
+    if span_days <= TIMELINE_MAX_POINTS:
+        return 'D', 'Daily'
+    if span_days <= TIMELINE_MAX_POINTS * 7:
+        return 'W', 'Weekly'
+    return 'MS', 'Monthly'
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def timeline_counts(timeline_src, freq):
+    """Count reviews per date bucket and sentiment
     
-    word_counts = Counter(all_words)
-    return word_counts.most_common(n)
+    timeline_src holds only 'at' and 'ai_sentiment', which Streamlit hashes in
+    a few milliseconds, so reruns with unchanged filters (a theme toggle, a
+    page switch) reuse the counts instead of regrouping.
+    """
+    return (
+        timeline_src.groupby([pd.Grouper(key='at', freq=freq), 'ai_sentiment'], observed=True)
+        .size()
+        .reset_index(name='count')
+        .rename(columns={'at': 'date'})
+    )
 
-def search_reviews(df, query):
-    """Search reviews by keyword"""
-    if not query:
+def search_reviews(df, review_text, query):
+    """Search reviews by keyword (review_text is the load_review_text() column)"""
+    if not query or review_text is None:
         return df
     
-    query_lower = query.lower()
-    mask = df['content'].str.lower().str.contains(query_lower, na=False)
-    return df[mask]
+    mask = review_text.loc[df.index].str.contains(query, case=False, na=False, regex=False)
+    return df[mask.to_numpy()]
+
+# Aspect keywords and the positive/negative terms used to score them
+ASPECT_KEYWORDS = {
+    'Price': {
+        'keywords': ['price', 'expensive', 'cheap', 'cost', 'rate', 'charges', 'overpriced', 'discount', 'refund'],
+        'positive': ['affordable', 'reasonable', 'fair', 'cheap', 'good price', 'value'],
+        'negative': ['expensive', 'costly', 'overpriced', 'high price']
+    },
+    'Service': {
+        'keywords': ['service', 'staff', 'attendant', 'customer service', 'support', 'help', 'response', 'assist'],
+        'positive': ['helpful', 'friendly', 'quick', 'efficient', 'good service', 'professional'],
+        'negative': ['rude', 'slow', 'poor service', 'unhelpful', 'bad staff', 'ignorant']
+    },
+    'App/Interface': {
+        'keywords': ['app', 'interface', 'ui', 'ux', 'design', 'button', 'feature', 'bug', 'crash', 'loading', 'freeze'],
+        'positive': ['smooth', 'easy', 'fast', 'intuitive', 'user-friendly', 'clean'],
+        'negative': ['crashes', 'slow', 'buggy', 'confusing', 'broken', 'laggy', 'freezes']
+    },
+    'Fuel Quality': {
+        'keywords': ['fuel', 'petrol', 'diesel', 'quality', 'purity', 'contamination', 'water', 'adulterated'],
+        'positive': ['good quality', 'pure', 'clean', 'premium'],
+        'negative': ['poor quality', 'contaminated', 'water', 'adulterated', 'fake', 'cheated']
+    },
+    'Location/Parking': {
+        'keywords': ['location', 'parking', 'place', 'pump', 'station', 'access', 'crowded', 'distance'],
+        'positive': ['convenient', 'accessible', 'easy access', 'good location', 'spacious'],
+        'negative': ['inconvenient', 'poor location', 'parking issue', 'crowded', 'hard to find']
+    }
+}
 
-@st.cache_data
 def analyze_aspects(text):
     """
     Analyze sentiment for specific aspects in review text.
@@ -601,38 +798,9 @@ def analyze_aspects(text):
     
     text_lower = str(text).lower()
     
-    # Define aspect keywords and their related terms
-    aspects = {
-        'Price': {
-            'keywords': ['price', 'expensive', 'cheap', 'cost', 'rate', 'charges', 'overpriced', 'discount', 'refund'],
-            'positive': ['affordable', 'reasonable', 'fair', 'cheap', 'good price', 'value'],
-            'negative': ['expensive', 'costly', 'overpriced', 'high price']
-        },
-        'Service': {
-            'keywords': ['service', 'staff', 'attendant', 'customer service', 'support', 'help', 'response', 'assist'],
-            'positive': ['helpful', 'friendly', 'quick', 'efficient', 'good service', 'professional'],
-            'negative': ['rude', 'slow', 'poor service', 'unhelpful', 'bad staff', 'ignorant']
-        },
-        'App/Interface': {
-            'keywords': ['app', 'interface', 'ui', 'ux', 'design', 'button', 'feature', 'bug', 'crash', 'loading', 'freeze'],
-            'positive': ['smooth', 'easy', 'fast', 'intuitive', 'user-friendly', 'clean'],
-            'negative': ['crashes', 'slow', 'buggy', 'confusing', 'broken', 'laggy', 'freezes']
-        },
-        'Fuel Quality': {
-            'keywords': ['fuel', 'petrol', 'diesel', 'quality', 'purity', 'contamination', 'water', 'adulterated'],
-            'positive': ['good quality', 'pure', 'clean', 'premium'],
-            'negative': ['poor quality', 'contaminated', 'water', 'adulterated', 'fake', 'cheated']
-        },
-        'Location/Parking': {
-            'keywords': ['location', 'parking', 'place', 'pump', 'station', 'access', 'crowded', 'distance'],
-            'positive': ['convenient', 'accessible', 'easy access', 'good location', 'spacious'],
-            'negative': ['inconvenient', 'poor location', 'parking issue', 'crowded', 'hard to find']
-        }
-    }
-    
     aspect_scores = {}
     
-    for aspect, keywords_dict in aspects.items():
+    for aspect, keywords_dict in ASPECT_KEYWORDS.items():
         if any(kw in text_lower for kw in keywords_dict['keywords']):
             sentiment_score = 0.5  # neutral default
             
@@ -651,30 +819,59 @@ def analyze_aspects(text):
     
     return aspect_scores
 
+def count_terms(text_lower, terms):
+    """Count how many of the given terms occur in each lowercased review"""
+    hits = [text_lower.str.contains(term, regex=False).to_numpy(dtype=bool) for term in terms]
+    return np.sum(hits, axis=0)
+
 def enrich_dataframe_with_aspects(df):
-    """Add aspect-based sentiment scores to dataframe"""
+    """Add aspect-based sentiment scores to dataframe
+    
+    Same scoring as analyze_aspects(), but each term is matched against the
+    whole column at once instead of looping over rows in Python.
+    """
     if 'aspect_sentiments' not in df.columns:
-        df['aspect_sentiments'] = df['content'].apply(analyze_aspects)
+        text_lower = df['content'].fillna('').astype(str).str.lower()
+        names = list(ASPECT_KEYWORDS)
+        mentioned = np.empty((len(df), len(names)), dtype=bool)
+        scores = np.empty((len(df), len(names)))
+        
+        for i, keywords_dict in enumerate(ASPECT_KEYWORDS.values()):
+            pattern = '|'.join(map(re.escape, keywords_dict['keywords']))
+            hit = text_lower.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+            mentioned[:, i] = hit
+            
+            # Only reviews that mention the aspect need scoring
+            positive_count = count_terms(text_lower[hit], keywords_dict['positive'])
+            negative_count = count_terms(text_lower[hit], keywords_dict['negative'])
+            score = np.where(positive_count > negative_count, 0.7 + (positive_count * 0.05),
+                             np.where(negative_count > positive_count, 0.3 - (negative_count * 0.05), 0.5))
+            scores[hit, i] = np.clip(score, 0.0, 1.0)
+        
+        df['aspect_sentiments'] = [
+            {name: score for name, score, hit in zip(names, row_scores, row_hits) if hit}
+            for row_scores, row_hits in zip(scores.tolist(), mentioned.tolist())
+        ]
     return df
 
-def create_density_plot(df, column, title):
-    """Create BPCL-style density plot with dark theme support"""
-    colors = get_theme_colors()
-    is_dark = st.session_state.theme == 'dark'
-    
-    fig = px.histogram(df, x=column, nbins=50, marginal="box",
-                       title=title,
-                       color_discrete_sequence=[colors['primary']])
-    
-    fig.update_traces(
-        marker_line_color=colors.get('border_bright', colors['border']),
-        marker_line_width=0.5,
-        opacity=0.85
-    )
+def merge_layout(base, overrides):
+    """Recursively merge Plotly layout overrides into a base layout dict"""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_layout(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def chart_layout(colors, **overrides):
+    """Shared BPCL chart layout with per-chart overrides merged in
     
-    fig.update_layout(
-        height=320,
-        showlegend=False,
+    Pass the result straight to go.Figure(layout=...) where possible; Plotly
+    builds a layout in the constructor several times faster than through a
+    later fig.update_layout() call.
+    """
+    layout = dict(
         plot_bgcolor=colors['plot_bg'],
         paper_bgcolor='rgba(0,0,0,0)',
         xaxis=dict(
@@ -684,18 +881,45 @@ def create_density_plot(df, column, title):
             title=dict(font=dict(color=colors['text'], size=13))
         ),
         yaxis=dict(
-            gridcolor=colors.get('grid_major', colors['grid']),
+            gridcolor=colors['grid_major'],
             gridwidth=1,
             tickfont=dict(color=colors['secondary_text'], size=11),
             title=dict(font=dict(color=colors['text'], size=13))
         ),
         title=dict(
-            font=dict(color=colors.get('text_bright', colors['text']), size=16),
+            font=dict(color=colors['text_bright'], size=16),
             x=0.05
         ),
         font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
         margin=dict(l=50, r=30, t=60, b=50)
     )
+    return merge_layout(layout, overrides)
+
+def create_density_plot(df, column, title):
+    """Create BPCL-style density plot with dark theme support"""
+    colors = get_theme_colors()
+    is_dark = st.session_state.theme == 'dark'
+    
+    # Histogram with a marginal box plot above it, on raw arrays
+    values = df[column].to_numpy()
+    marker = dict(color=colors['primary'],
+                  line=dict(color=colors['border_bright'], width=0.5))
+    fig = go.Figure(
+        [
+            go.Histogram(x=values, nbinsx=50, marker=marker, opacity=0.85, name=column),
+            go.Box(x=values, marker=marker, opacity=0.85, name=column, xaxis='x2', yaxis='y2')
+        ],
+        layout=chart_layout(
+            colors,
+            height=320,
+            showlegend=False,
+            title=dict(text=title),
+            xaxis=dict(title=dict(text=column)),
+            yaxis=dict(title=dict(text='count'), domain=[0, 0.74]),
+            xaxis2=dict(matches='x', anchor='y2', showticklabels=False, showgrid=False),
+            yaxis2=dict(domain=[0.75, 1], showticklabels=False, showgrid=False)
+        )
+    )
     
     return fig
 
@@ -704,38 +928,25 @@ def create_violin_plot(df, y_col, x_col, title):
     colors = get_theme_colors()
     is_dark = st.session_state.theme == 'dark'
     
-    fig = px.violin(df, y=y_col, x=x_col, box=True, points="outliers",
-                    title=title,
-                    color_discrete_sequence=[colors['primary'], colors['accent_green'], colors.get('accent_orange', colors['neutral'])])
-    
-    fig.update_traces(
-        marker_line_width=1.5,
-        marker_line_color=colors.get('border_bright', colors['border']),
-        opacity=0.8
-    )
-    
-    fig.update_layout(
-        height=380,
-        plot_bgcolor=colors['plot_bg'],
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(
-            gridcolor=colors['grid'],
-            gridwidth=1,
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            title=dict(font=dict(color=colors['text'], size=13))
-        ),
-        yaxis=dict(
-            gridcolor=colors.get('grid_major', colors['grid']),
-            gridwidth=1,
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            title=dict(font=dict(color=colors['text'], size=13))
+    fig = go.Figure(
+        go.Violin(
+            x=df[x_col].to_numpy(),
+            y=df[y_col].to_numpy(),
+            box_visible=True,
+            points='outliers',
+            marker=dict(color=colors['primary'],
+                        line=dict(color=colors['border_bright'], width=1.5)),
+            line_color=colors['primary'],
+            opacity=0.8,
+            name=y_col
         ),
-        title=dict(
-            font=dict(color=colors.get('text_bright', colors['text']), size=16),
-            x=0.05
-        ),
-        font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
-        margin=dict(l=50, r=30, t=60, b=50)
+        layout=chart_layout(
+            colors,
+            height=380,
+            title=dict(text=title),
+            xaxis=dict(title=dict(text=x_col)),
+            yaxis=dict(title=dict(text=y_col))
+        )
     )
     
     return fig
@@ -746,7 +957,8 @@ def create_sentiment_heatmap(df, topic_keywords):
     is_dark = st.session_state.theme == 'dark'
     
     if 'Topic_Label' in df.columns and 'ai_sentiment' in df.columns:
-        heatmap_data = pd.crosstab(df['ai_sentiment'], df['Topic_Label'], normalize='index') * 100
+        counts = df.groupby(['ai_sentiment', 'Topic_Label'], observed=True).size().unstack(fill_value=0)
+        heatmap_data = counts.div(counts.sum(axis=1), axis=0) * 100
         
         # BPCL color scale - green to red for sentiment
         color_scale = [[0, colors['negative']], [0.5, colors['neutral']], [1, colors['positive']]]
@@ -764,33 +976,18 @@ def create_sentiment_heatmap(df, topic_keywords):
         fig.update_traces(
             text=heatmap_data.values.round(1),
             texttemplate='%{text}%',
-            textfont=dict(size=11, color=colors.get('text_bright', colors['text']))
+            textfont=dict(size=11, color=colors['text_bright'])
         )
         
-        fig.update_layout(
+        fig.update_layout(chart_layout(
+            colors,
             height=380,
-            plot_bgcolor=colors['plot_bg'],
-            paper_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                tickfont=dict(color=colors['secondary_text'], size=11),
-                title=dict(font=dict(color=colors['text'], size=13)),
-                side='bottom'
-            ),
-            yaxis=dict(
-                tickfont=dict(color=colors['secondary_text'], size=11),
-                title=dict(font=dict(color=colors['text'], size=13))
-            ),
-            title=dict(
-                font=dict(color=colors.get('text_bright', colors['text']), size=16),
-                x=0.05
-            ),
-            font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
-            coloraxis_colorbar=dict(
+            xaxis=dict(side='bottom'),
+            coloraxis=dict(colorbar=dict(
                 tickfont=dict(color=colors['secondary_text'], size=10),
                 title=dict(font=dict(color=colors['text'], size=12))
-            ),
-            margin=dict(l=50, r=30, t=60, b=50)
-        )
+            ))
+        ))
         
         return fig
     
@@ -800,56 +997,42 @@ def create_sentiment_heatmap(df, topic_keywords):
 def create_topic_trend(df):
     """Create line chart showing topic volume over time."""
     colors = get_theme_colors()
-    if 'Topic_Label' not in df.columns or 'month_year' not in df.columns:
-        return None
-
-    trend_df = df.dropna(subset=['Topic_Label', 'month_year']).copy()
-    if trend_df.empty:
+    if 'Topic_Label' not in df.columns or 'at' not in df.columns:
         return None
 
-    # Ensure month ordering for x-axis
-    trend_df['month_year_dt'] = pd.to_datetime(trend_df['month_year'], errors='coerce')
-    trend_df = trend_df.dropna(subset=['month_year_dt'])
+    trend_df = df.dropna(subset=['Topic_Label', 'at'])
     if trend_df.empty:
         return None
 
+    # Bucket by month start straight from the datetime column (sorted by month)
     grouped = (
-        trend_df.groupby(['month_year_dt', 'Topic_Label'])
+        trend_df.groupby([pd.Grouper(key='at', freq='MS'), 'Topic_Label'], observed=True)
         .size()
         .reset_index(name='count')
-        .sort_values('month_year_dt')
+        .rename(columns={'at': 'month_year_dt'})
     )
 
-    fig = px.line(
-        grouped,
-        x='month_year_dt',
-        y='count',
-        color='Topic_Label',
-        markers=True,
-        title='Temporal Topic Evolution',
-    )
-
-    fig.update_layout(
-        height=360,
-        plot_bgcolor=colors['plot_bg'],
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(
-            title=dict(text='Month', font=dict(color=colors['text'], size=13)),
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            gridcolor=colors.get('grid_major', colors['grid']),
-            tickformat='%Y-%m'
-        ),
-        yaxis=dict(
-            title=dict(text='Review Count', font=dict(color=colors['text'], size=13)),
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            gridcolor=colors['grid']
-        ),
-        title=dict(
-            font=dict(color=colors.get('text_bright', colors['text']), size=16),
-            x=0.05
-        ),
-        font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
-        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+    fig = go.Figure(
+        [
+            go.Scatter(x=topic_rows['month_year_dt'], y=topic_rows['count'],
+                       mode='lines+markers', name=str(topic))
+            for topic, topic_rows in grouped.groupby('Topic_Label', observed=True)
+        ],
+        layout=chart_layout(
+            colors,
+            height=360,
+            title=dict(text='Temporal Topic Evolution'),
+            xaxis=dict(
+                title=dict(text='Month'),
+                gridcolor=colors['grid_major'],
+                tickformat='%Y-%m'
+            ),
+            yaxis=dict(title=dict(text='Review Count'), gridcolor=colors['grid']),
+            legend=dict(title=dict(text='Topic_Label'), orientation='h',
+                        yanchor='bottom', y=1.02, xanchor='right', x=1),
+            # Keep Plotly's default margins so the top legend has room
+            margin=None
+        )
     )
 
     return fig
@@ -861,17 +1044,16 @@ def create_topic_version_heatmap(df):
     if 'Topic_Label' not in df.columns or 'appVersion' not in df.columns:
         return None
 
-    base_df = df.dropna(subset=['Topic_Label', 'appVersion']).copy()
-    if base_df.empty:
-        return None
-
     # Limit to top versions by volume for readability
-    top_versions = base_df['appVersion'].value_counts().head(10).index
-    base_df = base_df[base_df['appVersion'].isin(top_versions)]
-    if base_df.empty:
-        return None
+    top_versions = df['appVersion'].value_counts().head(10).index
+    base_df = df[df['appVersion'].isin(top_versions)]
 
-    heatmap_data = pd.crosstab(base_df['appVersion'], base_df['Topic_Label'])
+    # groupby skips missing labels and, with observed=True, unused categories
+    heatmap_data = (
+        base_df.groupby(['appVersion', 'Topic_Label'], observed=True).size().unstack(fill_value=0)
+    )
+    if heatmap_data.empty:
+        return None
 
     fig = px.imshow(
         heatmap_data.values,
@@ -885,40 +1067,25 @@ def create_topic_version_heatmap(df):
     fig.update_traces(
         text=heatmap_data.values,
         texttemplate='%{text}',
-        textfont=dict(size=11, color=colors.get('text_bright', colors['text']))
+        textfont=dict(size=11, color=colors['text_bright'])
     )
 
-    fig.update_layout(
+    fig.update_layout(chart_layout(
+        colors,
         height=380,
-        plot_bgcolor=colors['plot_bg'],
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            title=dict(font=dict(color=colors['text'], size=13))
-        ),
-        yaxis=dict(
-            tickfont=dict(color=colors['secondary_text'], size=11),
-            title=dict(font=dict(color=colors['text'], size=13))
-        ),
-        title=dict(
-            font=dict(color=colors.get('text_bright', colors['text']), size=16),
-            x=0.05
-        ),
-        font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
-        coloraxis_colorbar=dict(
+        coloraxis=dict(colorbar=dict(
             tickfont=dict(color=colors['secondary_text'], size=10),
             title=dict(font=dict(color=colors['text'], size=12))
-        ),
-        margin=dict(l=50, r=30, t=60, b=50)
-    )
+        ))
+    ))
 
     return fig
 
-def create_gauge_chart(value, title="Sentiment Health"):
-    """Create BPCL-style gauge chart with dark theme support"""
+def create_gauge_html(value):
+    """Create a BPCL-style horizontal gauge bar as inline HTML (no Plotly figure)"""
     colors = get_theme_colors()
     is_dark = st.session_state.theme == 'dark'
-    normalized = (value + 1) * 50
+    normalized = min(max((value + 1) * 50, 0), 100)
     
     # BPCL color scheme for gauge
     bar_color = colors['primary']
@@ -927,55 +1094,93 @@ def create_gauge_chart(value, title="Sentiment Health"):
     elif normalized <= 33:
         bar_color = colors['negative']
     
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=normalized,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': title, 'font': {'size': 20, 'color': colors.get('text_bright', colors['text'])}},
-        number={
-            'font': {'size': 42, 'color': colors.get('text_bright', colors['text'])}, 
-            'suffix': '%'
-        },
-        gauge={
-            'axis': {
-                'range': [0, 100], 
-                'tickcolor': colors.get('grid_major', colors['grid']), 
-                'tickfont': {'color': colors['secondary_text'], 'size': 11}
-            },
-            'bar': {'color': bar_color, 'thickness': 0.8},
-            'bgcolor': "rgba(128, 128, 128, 0.05)" if is_dark else "rgba(128, 128, 128, 0.1)",
-            'borderwidth': 0,
-            'steps': [
-                {'range': [0, 33], 'color': f'rgba(255, 61, 0, {0.12 if is_dark else 0.2})'},
-                {'range': [33, 66], 'color': f'rgba(255, 167, 38, {0.12 if is_dark else 0.2})'},
-                {'range': [66, 100], 'color': f'rgba(0, 200, 83, {0.12 if is_dark else 0.2})'}
-            ],
-            'threshold': {
-                'line': {'color': colors.get('text_bright', colors['text']), 'width': 2},
-                'thickness': 0.75,
-                'value': normalized
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=70, b=20),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font={'color': colors['text'], 'family': 'Inter, system-ui, sans-serif'}
+    alpha = 0.12 if is_dark else 0.2
+    zones = (
+        f"rgba(255, 61, 0, {alpha}) 0% 33%, "
+        f"rgba(255, 167, 38, {alpha}) 33% 66%, "
+        f"rgba(0, 200, 83, {alpha}) 66% 100%"
     )
     
-    return fig
+    return f"""
+    <div style="margin: 0.25rem 0 1rem 0;">
+        <div style="position: relative; height: 22px; border-radius: 11px; background: linear-gradient(90deg, {zones});">
+            <div style="width: {normalized:.1f}%; height: 100%; border-radius: 11px; background: {bar_color};"></div>
+        </div>
+        <div style="display: flex; justify-content: space-between; font-size: 0.75rem; color: {colors['secondary_text']};">
+            <span>0</span><span>33</span><span>66</span><span>100</span>
+        </div>
+    </div>
+    """
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def export_to_csv(_df, filter_key, _review_text=None):
+    """Export filtered dataframe to CSV, cached per filter combination
+    
+    filter_key identifies the rows in _df (e.g. the data file signature plus the
+    apply_filters arguments), so the dataframe itself is not hashed on every rerun. Pass _review_text (from
+    load_review_text) to include each row's review text after its reviewId.
+    """
+    table = pa.Table.from_pandas(_df.drop(columns=['_tokens'], errors='ignore'), preserve_index=False)
+    if _review_text is not None:
+        position = table.column_names.index('reviewId') + 1 if 'reviewId' in table.column_names else 0
+        table = table.add_column(position, 'content', pa.array(_review_text.loc[_df.index], type=pa.string()))
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            # Categorical labels are written as plain strings; not every pyarrow
+            # release the requirements allow can write dictionary columns to CSV
+            table = table.set_column(i, field.name, table[field.name].cast(field.type.value_type))
+        elif pa.types.is_timestamp(field.type):
+            # Whole seconds, so dates don't print a trailing .000000
+            table = table.set_column(i, field.name, table[field.name].cast(pa.timestamp('s'), safe=False))
+    
+    # PyArrow's CSV writer is several times faster than DataFrame.to_csv
+    buffer = io.BytesIO()
+    pa_csv.write_csv(table, buffer)
+    return buffer.getvalue()
 
-def export_to_csv(df):
-    """Export filtered dataframe to CSV"""
-    return df.to_csv(index=False).encode('utf-8')
+@st.cache_data(show_spinner=False, max_entries=16)
+def apply_filters(_df, _review_text, signature, search_query, selected_version, selected_topic,
+                  selected_sentiment, min_rating, max_rating, start_date, end_date):
+    """Apply sidebar filters to the dataset, cached on the filter values.
+    
+    The leading underscores keep Streamlit from hashing the full dataframe and
+    review text on every rerun; they are always the cached outputs of
+    load_data(signature) and load_review_text(signature), so the hashed
+    signature ties each entry to the data file version.
+    """
+    # Combine the cheap column filters into one mask so the frame is indexed once
+    mask = np.ones(len(_df), dtype=bool)
+    
+    if selected_version != 'All':
+        mask &= (_df['appVersion'] == selected_version).to_numpy()
+    
+    if selected_topic != 'All':
+        mask &= (_df['Topic_Label'] == selected_topic).to_numpy()
+    
+    if selected_sentiment != 'All':
+        mask &= (_df['ai_sentiment'] == selected_sentiment).to_numpy()
+    
+    if min_rating is not None and max_rating is not None:
+        mask &= _df['score'].between(min_rating, max_rating).to_numpy()
+    
+    if start_date is not None and end_date is not None:
+        # Compare as timestamps; the end date is inclusive up to midnight
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        mask &= ((_df['at'] >= start_ts) & (_df['at'] < end_ts)).to_numpy()
+    
+    filtered_df = _df[mask]
+    
+    # Text search is the slowest filter, so it only scans the rows left over
+    if search_query:
+        filtered_df = search_reviews(filtered_df, _review_text, search_query)
+    
+    return filtered_df
 
 # =============================================================================
 # SIDEBAR CONFIGURATION
 # =============================================================================
-def setup_sidebar_filters(df, topic_keywords):
+def setup_sidebar_filters(df, review_text, signature, topic_keywords):
     """Setup sidebar with filters and theme toggle"""
     
     st.sidebar.markdown("## 🎛️ Dashboard Controls")
@@ -997,100 +1202,92 @@ def setup_sidebar_filters(df, topic_keywords):
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🔍 Filters")
     
-    # Search functionality
-    search_query = st.sidebar.text_input("🔎 Search reviews (keywords):")
-    
-    # Version filter
-    versions = ['All'] + sorted(df['appVersion'].dropna().unique().tolist(), 
-                               key=lambda x: [int(p) if p.isdigit() else 0 for p in str(x).split('.')])
-    selected_version = st.sidebar.selectbox("📱 App Version", versions)
-    
-    # Date range filter
-    if 'at' in df.columns:
-        min_date = df['at'].min()
-        max_date = df['at'].max()
+    # Filter widgets live in a form so edits are applied together on submit
+    # instead of rerunning the whole page per keystroke or slider drag
+    with st.sidebar.form("sidebar_filters", border=False):
+        # Search functionality
+        search_query = st.text_input("🔎 Search reviews (keywords):")
         
-        st.sidebar.markdown(f"📅 **Date Range** (Latest: {max_date.date()})")
+        # Version filter
+        versions = ['All'] + df['appVersion'].cat.categories.tolist()
+        selected_version = st.selectbox("📱 App Version", versions)
         
-        # Preset date ranges based on max_date
-        date_preset = st.sidebar.selectbox(
-            "Quick Select:",
-            ["All Data", "Past Week", "Past Month", "Past 3 Months", "Past Year", "Custom"],
-            label_visibility="collapsed"
-        )
+        # Date range filter
+        if 'at' in df.columns:
+            min_date = df['at'].min()
+            max_date = df['at'].max()
+            
+            st.markdown(f"📅 **Date Range** (Latest: {max_date.date()})")
+            
+            # Preset date ranges based on max_date
+            date_preset = st.selectbox(
+                "Quick Select:",
+                ["All Data", "Past Week", "Past Month", "Past 3 Months", "Past Year", "Custom"],
+                label_visibility="collapsed",
+                help="Choose Custom and apply to pick exact dates"
+            )
+            
+            if date_preset == "All Data":
+                date_range = (min_date.date(), max_date.date())
+            elif date_preset == "Past Week":
+                start = max_date - timedelta(days=7)
+                date_range = (start.date(), max_date.date())
+            elif date_preset == "Past Month":
+                start = max_date - timedelta(days=30)
+                date_range = (start.date(), max_date.date())
+            elif date_preset == "Past 3 Months":
+                start = max_date - timedelta(days=90)
+                date_range = (start.date(), max_date.date())
+            elif date_preset == "Past Year":
+                start = max_date - timedelta(days=365)
+                date_range = (start.date(), max_date.date())
+            else:  # Custom
+                date_range = st.date_input(
+                    "Select custom range:",
+                    value=(min_date.date(), max_date.date()),
+                    min_value=min_date.date(),
+                    max_value=max_date.date(),
+                    label_visibility="collapsed"
+                )
+        else:
+            date_range = None
+        
+        # Topic filter
+        if 'Topic_Label' in df.columns:
+            raw_topics = ['All'] + df['Topic_Label'].cat.categories.tolist()
+            topic_display = ['All'] + [format_topic_label(t, topic_keywords) for t in raw_topics[1:]]
+            selected_topic_idx = st.selectbox("🏷️ Topic", range(len(topic_display)), 
+                                              format_func=lambda x: topic_display[x])
+            selected_topic = raw_topics[selected_topic_idx]
+        else:
+            selected_topic = 'All'
+        
+        # Sentiment filter
+        sentiments = ['All', 'Negative', 'Neutral', 'Positive']
+        selected_sentiment = st.selectbox("😊 Sentiment", sentiments)
         
-        if date_preset == "All Data":
-            date_range = (min_date.date(), max_date.date())
-        elif date_preset == "Past Week":
-            start = max_date - timedelta(days=7)
-            date_range = (start.date(), max_date.date())
-        elif date_preset == "Past Month":
-            start = max_date - timedelta(days=30)
-            date_range = (start.date(), max_date.date())
-        elif date_preset == "Past 3 Months":
-            start = max_date - timedelta(days=90)
-            date_range = (start.date(), max_date.date())
-        elif date_preset == "Past Year":
-            start = max_date - timedelta(days=365)
-            date_range = (start.date(), max_date.date())
-        else:  # Custom
-            date_range = st.sidebar.date_input(
-                "Select custom range:",
-                value=(min_date.date(), max_date.date()),
-                min_value=min_date.date(),
-                max_value=max_date.date(),
-                label_visibility="collapsed"
+        # Rating filter
+        if 'score' in df.columns:
+            min_rating, max_rating = st.slider(
+                "⭐ Rating Range",
+                min_value=int(df['score'].min()),
+                max_value=int(df['score'].max()),
+                value=(int(df['score'].min()), int(df['score'].max()))
             )
-    else:
-        date_range = None
-    
-    # Topic filter
-    if 'Topic_Label' in df.columns:
-        raw_topics = ['All'] + sorted(df['Topic_Label'].dropna().unique().tolist())
-        topic_display = ['All'] + [format_topic_label(t, topic_keywords) for t in raw_topics[1:]]
-        selected_topic_idx = st.sidebar.selectbox("🏷️ Topic", range(len(topic_display)), 
-                                                 format_func=lambda x: topic_display[x])
-        selected_topic = raw_topics[selected_topic_idx]
-    else:
-        selected_topic = 'All'
-    
-    # Sentiment filter
-    sentiments = ['All', 'Negative', 'Neutral', 'Positive']
-    selected_sentiment = st.sidebar.selectbox("😊 Sentiment", sentiments)
-    
-    # Rating filter
-    if 'score' in df.columns:
-        min_rating, max_rating = st.sidebar.slider(
-            "⭐ Rating Range",
-            min_value=int(df['score'].min()),
-            max_value=int(df['score'].max()),
-            value=(int(df['score'].min()), int(df['score'].max()))
-        )
-    else:
-        min_rating, max_rating = None, None
+        else:
+            min_rating, max_rating = None, None
+        
+        st.form_submit_button("✅ Apply Filters", use_container_width=True)
     
     # Apply filters
-    filtered_df = df.copy()
-    
-    if search_query:
-        filtered_df = search_reviews(filtered_df, search_query)
-    
-    if selected_version != 'All':
-        filtered_df = filtered_df[filtered_df['appVersion'] == selected_version]
-    
-    if selected_topic != 'All':
-        filtered_df = filtered_df[filtered_df['Topic_Label'] == selected_topic]
-    
-    if selected_sentiment != 'All':
-        filtered_df = filtered_df[filtered_df['ai_sentiment'] == selected_sentiment]
-    
-    if min_rating is not None and max_rating is not None:
-        filtered_df = filtered_df[(filtered_df['score'] >= min_rating) & (filtered_df['score'] <= max_rating)]
-    
     if date_range and len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_df = filtered_df[(filtered_df['at'].dt.date >= start_date) & 
-                                (filtered_df['at'].dt.date <= end_date)]
+    else:
+        start_date, end_date = None, None
+    
+    filter_key = (search_query, selected_version, selected_topic, selected_sentiment,
+                  min_rating, max_rating, start_date, end_date)
+    filtered_df = apply_filters(df, review_text, signature, *filter_key)
     
     # Sidebar stats
     st.sidebar.markdown("---")
@@ -1102,7 +1299,7 @@ def setup_sidebar_filters(df, topic_keywords):
     # Export button
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📥 Export")
-    csv = export_to_csv(filtered_df)
+    csv = export_to_csv(filtered_df, (signature, *filter_key), review_text)
     st.sidebar.download_button(
         label="📥 Download Filtered Data (CSV)",
         data=csv,
@@ -1110,14 +1307,13 @@ def setup_sidebar_filters(df, topic_keywords):
         mime="text/csv"
     )
     
-    return filtered_df, search_query
+    return filtered_df
 
 # =============================================================================
 # PAGE: OVERVIEW
 # =============================================================================
-def page_overview(df, topic_keywords):
+def page_overview(df, filtered_df, topic_keywords):
     """Overview page with key metrics and gauges"""
-    filtered_df, search_query = setup_sidebar_filters(df, topic_keywords)
     colors = get_theme_colors()
     
     st.markdown('<h1 class="main-header">📊 BPCL Reviews Analytics Dashboard</h1>', unsafe_allow_html=True)
@@ -1153,25 +1349,27 @@ def page_overview(df, topic_keywords):
     st.markdown("---")
     
     # Sentiment breakdown - Key metrics row 2
+    sentiment_vc = filtered_df['ai_sentiment'].value_counts()
+    total = len(filtered_df)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        neg_count = len(filtered_df[filtered_df['ai_sentiment'] == 'Negative'])
-        neg_pct = neg_count / len(filtered_df) * 100 if len(filtered_df) > 0 else 0
+        neg_count = int(sentiment_vc.get('Negative', 0))
+        neg_pct = neg_count / total * 100 if total > 0 else 0
         st.metric("🔴 Negative", f"{neg_count:,}", f"{neg_pct:.1f}%")
     
     with col2:
-        neu_count = len(filtered_df[filtered_df['ai_sentiment'] == 'Neutral'])
-        neu_pct = neu_count / len(filtered_df) * 100 if len(filtered_df) > 0 else 0
+        neu_count = int(sentiment_vc.get('Neutral', 0))
+        neu_pct = neu_count / total * 100 if total > 0 else 0
         st.metric("🟡 Neutral", f"{neu_count:,}", f"{neu_pct:.1f}%")
     
     with col3:
-        pos_count = len(filtered_df[filtered_df['ai_sentiment'] == 'Positive'])
-        pos_pct = pos_count / len(filtered_df) * 100 if len(filtered_df) > 0 else 0
+        pos_count = int(sentiment_vc.get('Positive', 0))
+        pos_pct = pos_count / total * 100 if total > 0 else 0
         st.metric("🟢 Positive", f"{pos_count:,}", f"{pos_pct:.1f}%")
     
     with col4:
-        if len(filtered_df) > 0:
+        if total > 0:
             response_rate = (neg_pct + pos_pct)
             st.metric("💬 Response Rate", f"{response_rate:.2f}%", 
                      f"{100-response_rate:.1f}% neutral")
@@ -1182,12 +1380,9 @@ def page_overview(df, topic_keywords):
     if 'at' in filtered_df.columns and len(filtered_df) > 0:
         st.markdown("### 📈 Review Volume & Sentiment Trends")
         
-        # Prepare daily data
-        daily_data = filtered_df.copy()
-        daily_data['date'] = daily_data['at'].dt.date
-        
-        # Aggregate by date and sentiment
-        timeline_df = daily_data.groupby(['date', 'ai_sentiment']).size().reset_index(name='count')
+        # Aggregate by date bucket and sentiment, coarsening long ranges
+        freq, freq_label = get_timeline_frequency(filtered_df['at'].min(), filtered_df['at'].max())
+        timeline_df = timeline_counts(filtered_df[['at', 'ai_sentiment']], freq)
         
         # Create BPCL-styled Altair chart
         is_dark = st.session_state.theme == 'dark'
@@ -1215,7 +1410,7 @@ def page_overview(df, topic_keywords):
                        titleColor=colors['text'],
                        titleFontSize=13,
                        labelFontSize=10,
-                       gridColor=colors.get('grid_major', colors['grid']),
+                       gridColor=colors['grid_major'],
                        domainColor=colors['border']
                    )),
             color=alt.Color('ai_sentiment:N', 
@@ -1230,7 +1425,7 @@ def page_overview(df, topic_keywords):
                               labelColor=colors['text'],
                               labelFontSize=11,
                               orient='top-right',
-                              fillColor=colors.get('card_bg', colors['secondary_bg']) if is_dark else 'white',
+                              fillColor=colors['card_bg'] if is_dark else 'white',
                               strokeColor=colors['border'],
                               padding=10,
                               cornerRadius=8
@@ -1245,21 +1440,21 @@ def page_overview(df, topic_keywords):
         chart = line.properties(
             height=360,
             title=alt.TitleParams(
-                text='Daily Review Volume by Sentiment',
+                text=f'{freq_label} Review Volume by Sentiment',
                 fontSize=16,
-                color=colors.get('text_bright', colors['text']),
+                color=colors['text_bright'],
                 anchor='start',
                 offset=10
             ),
-            background=colors.get('plot_bg', colors['secondary_bg'])
+            background=colors['plot_bg']
         ).configure_view(
             strokeWidth=0,
-            fill=colors.get('plot_bg', colors['secondary_bg'])
+            fill=colors['plot_bg']
         ).configure_axis(
             grid=True
         )
         
-        st.altair_chart(chart, use_container_width=True)
+        st.altair_chart(chart, use_container_width=True, key="overview_timeline")
     
     st.markdown("---")
     
@@ -1269,8 +1464,10 @@ def page_overview(df, topic_keywords):
     with col_left:
         st.markdown("### 🌡️ Sentiment Health Gauge")
         global_sentiment = filtered_df['sentiment_score'].mean() if 'sentiment_score' in filtered_df.columns else 0
-        gauge_fig = create_gauge_chart(global_sentiment, "Sentiment Score")
-        st.plotly_chart(gauge_fig, use_container_width=True)
+        if pd.isna(global_sentiment):
+            global_sentiment = 0
+        st.metric("Sentiment Score", f"{(global_sentiment + 1) * 50:.1f}%")
+        st.markdown(create_gauge_html(global_sentiment), unsafe_allow_html=True)
         
         # Interpretation
         if global_sentiment > 0.3:
@@ -1282,7 +1479,7 @@ def page_overview(df, topic_keywords):
     
     with col_right:
         st.markdown("### 📊 Sentiment Distribution")
-        sentiment_counts = filtered_df['ai_sentiment'].value_counts()
+        sentiment_counts = sentiment_vc[sentiment_vc > 0]
         fig_dist = px.pie(values=sentiment_counts.values, names=sentiment_counts.index,
                          title="Overall Sentiment Breakdown",
                          color_discrete_map={'Positive': colors['positive'], 
@@ -1292,15 +1489,15 @@ def page_overview(df, topic_keywords):
         fig_dist.update_traces(
             textposition='inside',
             textinfo='percent+label',
-            textfont=dict(size=13, color=colors.get('text_bright', colors['text'])),
-            marker=dict(line=dict(color=colors.get('border_bright', colors['border']), width=1.5))
+            textfont=dict(size=13, color=colors['text_bright']),
+            marker=dict(line=dict(color=colors['border_bright'], width=1.5))
         )
         fig_dist.update_layout(
             height=350, 
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor='rgba(0,0,0,0)',
             title=dict(
-                font=dict(color=colors.get('text_bright', colors['text']), size=16),
+                font=dict(color=colors['text_bright'], size=16),
                 x=0.5,
                 xanchor='center'
             ),
@@ -1313,7 +1510,7 @@ def page_overview(df, topic_keywords):
             ),
             margin=dict(l=20, r=20, t=60, b=20)
         )
-        st.plotly_chart(fig_dist, use_container_width=True)
+        st.plotly_chart(fig_dist, use_container_width=True, key="overview_pie")
     
     st.markdown("---")
     
@@ -1323,60 +1520,38 @@ def page_overview(df, topic_keywords):
         
         rating_counts = filtered_df['score'].value_counts().sort_index()
         
-        fig_rating = go.Figure(data=[
-            go.Bar(
+        fig_rating = go.Figure(
+            data=[go.Bar(
                 x=rating_counts.index,
                 y=rating_counts.values,
                 marker=dict(
                     color=[colors['negative'], colors['negative'], colors['neutral'], 
                           colors['positive'], colors['positive']],
-                    line=dict(color=colors.get('border_bright', colors['border']), width=1.2)
+                    line=dict(color=colors['border_bright'], width=1.2)
                 ),
                 text=rating_counts.values,
                 textposition='outside',
-                textfont=dict(size=12, color=colors.get('text_bright', colors['text'])),
+                textfont=dict(size=12, color=colors['text_bright']),
                 hovertemplate='<b>%{x} Stars</b><br>Count: %{y:,}<extra></extra>',
                 opacity=0.9
+            )],
+            layout=chart_layout(
+                colors,
+                height=320,
+                title=dict(text="Distribution by Star Rating"),
+                xaxis=dict(title=dict(text="Star Rating"), tickmode='linear', tick0=1, dtick=1),
+                yaxis=dict(title=dict(text="Number of Reviews")),
+                bargap=0.3
             )
-        ])
-        
-        fig_rating.update_layout(
-            title=dict(
-                text="Distribution by Star Rating",
-                font=dict(color=colors.get('text_bright', colors['text']), size=16),
-                x=0.05
-            ),
-            xaxis=dict(
-                title=dict(text="Star Rating", font=dict(color=colors['text'], size=13)),
-                gridcolor=colors['grid'],
-                gridwidth=1,
-                tickfont=dict(color=colors['secondary_text'], size=11),
-                tickmode='linear',
-                tick0=1,
-                dtick=1
-            ),
-            yaxis=dict(
-                title=dict(text="Number of Reviews", font=dict(color=colors['text'], size=13)),
-                gridcolor=colors.get('grid_major', colors['grid']),
-                gridwidth=1,
-                tickfont=dict(color=colors['secondary_text'], size=11)
-            ),
-            height=320,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor=colors['plot_bg'],
-            font=dict(color=colors['text'], family='Inter, system-ui, sans-serif'),
-            margin=dict(l=50, r=30, t=60, b=50),
-            bargap=0.3
         )
         
-        st.plotly_chart(fig_rating, use_container_width=True)
+        st.plotly_chart(fig_rating, use_container_width=True, key="overview_rating")
 
 # =============================================================================
 # PAGE: TOPICS
 # =============================================================================
-def page_topics(df, topic_keywords):
+def page_topics(filtered_df, topic_keywords):
     """Topics analysis page"""
-    filtered_df, search_query = setup_sidebar_filters(df, topic_keywords)
     
     st.markdown('<h1 class="main-header">🏷️ Topic Analysis</h1>', unsafe_allow_html=True)
     
@@ -1390,6 +1565,7 @@ def page_topics(df, topic_keywords):
         st.markdown("### 📊 Topic Distribution")
         colors = get_theme_colors()
         topic_counts = filtered_df['Topic_Label'].value_counts()
+        topic_counts = topic_counts[topic_counts > 0]
         fig_topics = px.bar(x=topic_counts.values, y=topic_counts.index,
                            orientation='h', title="Topics by Review Count")
         fig_topics.update_layout(
@@ -1404,25 +1580,25 @@ def page_topics(df, topic_keywords):
             yaxis_tickfont_color=colors['text'],
             font_color=colors['text']
         )
-        st.plotly_chart(fig_topics, use_container_width=True)
+        st.plotly_chart(fig_topics, use_container_width=True, key="topics_bar")
     
     with col2:
         st.markdown("### 🎯 Topic-Sentiment Heatmap")
         fig_heatmap = create_sentiment_heatmap(filtered_df, topic_keywords)
         if fig_heatmap:
-            st.plotly_chart(fig_heatmap, use_container_width=True)
+            st.plotly_chart(fig_heatmap, use_container_width=True, key="topics_heatmap")
 
     st.markdown("### ⏳ Temporal Topic Evolution")
     fig_topic_trend = create_topic_trend(filtered_df)
     if fig_topic_trend:
-        st.plotly_chart(fig_topic_trend, use_container_width=True)
+        st.plotly_chart(fig_topic_trend, use_container_width=True, key="topics_trend")
     else:
-        st.info("Add dates (month_year) and topics to view trend over time.")
+        st.info("Add review dates and topics to view trend over time.")
 
     st.markdown("### 🧭 Topic-Version Correlation")
     fig_topic_version = create_topic_version_heatmap(filtered_df)
     if fig_topic_version:
-        st.plotly_chart(fig_topic_version, use_container_width=True)
+        st.plotly_chart(fig_topic_version, use_container_width=True, key="topics_version_heatmap")
     else:
         st.info("Add appVersion and topic labels to explore version-topic signals.")
     
@@ -1432,38 +1608,38 @@ def page_topics(df, topic_keywords):
     st.markdown("### 🔍 Topic Deep Dive")
     
     if 'Topic_Label' in filtered_df.columns:
-        raw_topics = sorted(filtered_df['Topic_Label'].dropna().unique().tolist())
-        selected_topic = st.selectbox("Select Topic:", 
-                                     [format_topic_label(t, topic_keywords) for t in raw_topics],
-                                     key="topic_deepdive")
-        
-        # Find original topic label
-        topic_idx = [format_topic_label(t, topic_keywords) for t in raw_topics].index(selected_topic)
+        raw_topics = observed_categories(filtered_df['Topic_Label'])
+        # Format each label once and select by position to get the raw label back
+        topic_display = [format_topic_label(t, topic_keywords) for t in raw_topics]
+        topic_idx = st.selectbox("Select Topic:", range(len(topic_display)),
+                                 format_func=lambda x: topic_display[x],
+                                 key="topic_deepdive")
+        selected_topic = topic_display[topic_idx]
         selected_topic_label = raw_topics[topic_idx]
         
         topic_df = filtered_df[filtered_df['Topic_Label'] == selected_topic_label]
+        topic_vc = topic_df['ai_sentiment'].value_counts()
         
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Reviews", len(topic_df))
         with col2:
-            pos_pct = len(topic_df[topic_df['ai_sentiment'] == 'Positive']) / len(topic_df) * 100
+            pos_pct = topic_vc.get('Positive', 0) / len(topic_df) * 100
             st.metric("Positive %", f"{pos_pct:.1f}%")
         with col3:
-            neg_pct = len(topic_df[topic_df['ai_sentiment'] == 'Negative']) / len(topic_df) * 100
+            neg_pct = topic_vc.get('Negative', 0) / len(topic_df) * 100
             st.metric("Negative %", f"{neg_pct:.1f}%")
         
         st.markdown(f"**Top Keywords for {selected_topic}:**")
-        top_kw = get_top_keywords(topic_df['content'].tolist(), n=15)
+        top_kw = get_top_keywords(topic_df['_tokens'], n=15)
         kw_text = ", ".join([f"{word}({count})" for word, count in top_kw])
         st.write(kw_text)
 
 # =============================================================================
 # PAGE: SENTIMENT ANALYSIS
 # =============================================================================
-def page_sentiment(df, topic_keywords):
+def page_sentiment(filtered_df, topic_keywords):
     """Sentiment analysis page with advanced visualizations"""
-    filtered_df, search_query = setup_sidebar_filters(df, topic_keywords)
     
     st.markdown('<h1 class="main-header">😊 Sentiment Analysis</h1>', unsafe_allow_html=True)
     
@@ -1474,7 +1650,7 @@ def page_sentiment(df, topic_keywords):
         if 'ai_sentiment' in filtered_df.columns:
             fig_violin = create_violin_plot(filtered_df, 'score', 'ai_sentiment', 
                                            "Rating Distribution by Sentiment")
-            st.plotly_chart(fig_violin, use_container_width=True)
+            st.plotly_chart(fig_violin, use_container_width=True, key="sentiment_violin")
     
     st.markdown("---")
     
@@ -1486,24 +1662,24 @@ def page_sentiment(df, topic_keywords):
             st.markdown("### 📈 Sentiment Score Distribution")
             fig_density = create_density_plot(filtered_df, 'sentiment_score', 
                                             "Sentiment Score Density")
-            st.plotly_chart(fig_density, use_container_width=True)
+            st.plotly_chart(fig_density, use_container_width=True, key="sentiment_density_score")
     
     with col2:
         if 'score' in filtered_df.columns:
             st.markdown("### ⭐ Rating Density")
             fig_rating = create_density_plot(filtered_df, 'score', "Rating Density")
-            st.plotly_chart(fig_rating, use_container_width=True)
+            st.plotly_chart(fig_rating, use_container_width=True, key="sentiment_density_rating")
     
     st.markdown("---")
     
     # Keyword comparison
     st.markdown("### 📝 Keyword Comparison")
     
-    neg_texts = filtered_df[filtered_df['ai_sentiment'] == 'Negative']['content'].tolist()
-    pos_texts = filtered_df[filtered_df['ai_sentiment'] == 'Positive']['content'].tolist()
+    neg_tokens = filtered_df.loc[filtered_df['ai_sentiment'] == 'Negative', '_tokens']
+    pos_tokens = filtered_df.loc[filtered_df['ai_sentiment'] == 'Positive', '_tokens']
     
-    neg_keywords = get_top_keywords(neg_texts, n=10)
-    pos_keywords = get_top_keywords(pos_texts, n=10)
+    neg_keywords = get_top_keywords(neg_tokens, n=10)
+    pos_keywords = get_top_keywords(pos_tokens, n=10)
     
     if neg_keywords and pos_keywords:
         colors = get_theme_colors()
@@ -1514,36 +1690,37 @@ def page_sentiment(df, topic_keywords):
         )
         
         neg_words, neg_counts = zip(*neg_keywords) if neg_keywords else ([], [])
-        fig_comp.add_trace(
-            go.Bar(x=list(neg_counts), y=list(neg_words), orientation='h',
-                  marker_color='#ef4444', name='Negative'),
-            row=1, col=1
-        )
-        
         pos_words, pos_counts = zip(*pos_keywords) if pos_keywords else ([], [])
-        fig_comp.add_trace(
-            go.Bar(x=list(pos_counts), y=list(pos_words), orientation='h',
-                  marker_color='#10b981', name='Positive'),
-            row=1, col=2
+        fig_comp.add_traces(
+            [
+                go.Bar(x=list(neg_counts), y=list(neg_words), orientation='h',
+                       marker_color='#ef4444', name='Negative'),
+                go.Bar(x=list(pos_counts), y=list(pos_words), orientation='h',
+                       marker_color='#10b981', name='Positive')
+            ],
+            rows=[1, 1], cols=[1, 2]
         )
         
-        fig_comp.update_layout(
-            height=350, 
-            showlegend=False, 
+        # One nested layout update instead of per-property and per-axis calls
+        fig_comp.update_layout(dict(
+            height=350,
+            showlegend=False,
             paper_bgcolor='rgba(0,0,0,0)',
             plot_bgcolor=colors['plot_bg'],
-            xaxis_gridcolor=colors['grid'],
-            xaxis2_gridcolor=colors['grid'],
-            title_font_color=colors['text'],
-            xaxis_title_font_color=colors['text'],
-            yaxis_title_font_color=colors['text'],
-            xaxis_tickfont_color=colors['text'],
-            yaxis_tickfont_color=colors['text'],
-            font_color=colors['text']
-        )
-        fig_comp.update_xaxes(title_text="Count", row=1, col=1)
-        fig_comp.update_xaxes(title_text="Count", row=1, col=2)
-        st.plotly_chart(fig_comp, use_container_width=True)
+            xaxis=dict(
+                gridcolor=colors['grid'],
+                tickfont=dict(color=colors['text']),
+                title=dict(text="Count", font=dict(color=colors['text']))
+            ),
+            xaxis2=dict(gridcolor=colors['grid'], title=dict(text="Count")),
+            yaxis=dict(
+                tickfont=dict(color=colors['text']),
+                title=dict(font=dict(color=colors['text']))
+            ),
+            title=dict(font=dict(color=colors['text'])),
+            font=dict(color=colors['text'])
+        ))
+        st.plotly_chart(fig_comp, use_container_width=True, key="sentiment_keyword_comp")
 
 # =============================================================================
 # PAGE: ASPECT ANALYSIS
@@ -1556,24 +1733,43 @@ def load_aspect_data():
         # Parse date column
         if 'Date' in df.columns:
             df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+        # Few distinct labels: counts and comparisons run on integer codes
+        for col in ('Aspect', 'Sentiment'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         return df
     except FileNotFoundError:
         st.error("⚠️ File 'HelloBPCL_Detailed_Analysis.csv' not found.")
         return None
 
+@st.cache_data(show_spinner=False)
+def load_aspect_summary():
+    """Sentiment labels and total row count of the aspect data"""
+    df = load_aspect_data()
+    if df is None:
+        return None
+    return sorted(df['Sentiment'].dropna().unique()), len(df)
+
+@st.cache_data(show_spinner=False)
+def load_aspect_partition(sentiment):
+    """Aspect rows for one sentiment, cached separately so a rerun only
+    unpickles that slice instead of the whole aspect table"""
+    df = load_aspect_data()
+    return df[df['Sentiment'] == sentiment]
+
 def page_aspects(topic_keywords):
     """Aspect Analysis page with detailed insights and drill-down"""
     st.markdown("# 🎯 Aspect Analysis")
     st.markdown("---")
     
     # Load data
-    df = load_aspect_data()
-    if df is None:
+    summary = load_aspect_summary()
+    if summary is None:
         st.stop()
+    sentiments, total_reviews = summary
     
     # Sidebar filter for sentiment
     st.sidebar.markdown("## 📋 Aspect Filters")
-    sentiments = sorted(df['Sentiment'].unique())
     selected_sentiment = st.sidebar.selectbox(
         "Sentiment", 
         sentiments,
@@ -1582,24 +1778,29 @@ def page_aspects(topic_keywords):
     )
     
     # Filter by sentiment
-    filtered_df = df[df['Sentiment'] == selected_sentiment].copy()
+    filtered_df = load_aspect_partition(selected_sentiment)
     
     # =========================================================================
     # KPIs SECTION
     # =========================================================================
     colors = get_theme_colors()
     
+    # One count serves the KPIs, the top-aspects chart and the drill-down list;
+    # aspects only seen under other sentiments count 0 here and are dropped
+    aspect_vc = filtered_df['Aspect'].value_counts()
+    aspect_vc = aspect_vc[aspect_vc > 0]
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         st.metric(
             "📊 Total Reviews",
             f"{len(filtered_df):,}",
-            delta=f"From {len(df):,} total"
+            delta=f"From {total_reviews:,} total"
         )
     
     with col2:
-        unique_aspects = filtered_df['Aspect'].nunique()
+        unique_aspects = len(aspect_vc)
         st.metric(
             "🏷️ Unique Aspects",
             f"{unique_aspects}",
@@ -1608,8 +1809,8 @@ def page_aspects(topic_keywords):
     
     with col3:
         if len(filtered_df) > 0:
-            top_aspect = filtered_df['Aspect'].value_counts().index[0]
-            top_count = filtered_df['Aspect'].value_counts().values[0]
+            top_aspect = aspect_vc.index[0]
+            top_count = aspect_vc.iloc[0]
             st.metric(
                 "🔴 #1 Aspect",
                 f"{top_aspect}",
@@ -1627,13 +1828,12 @@ def page_aspects(topic_keywords):
     
     if len(filtered_df) > 0:
         # Count aspects
-        aspect_counts = filtered_df['Aspect'].value_counts().head(15)
-        
-        # Create horizontal bar chart
-        fig = go.Figure()
+        aspect_counts = aspect_vc.head(15)
         
-        fig.add_trace(
-            go.Bar(
+        # Trace and layout go to the constructor: validating them there is
+        # much cheaper than add_trace() plus a keyword-heavy update_layout()
+        fig = go.Figure(
+            data=go.Bar(
                 y=aspect_counts.index,
                 x=aspect_counts.values,
                 orientation='h',
@@ -1647,27 +1847,28 @@ def page_aspects(topic_keywords):
                 textposition='auto',
                 hovertemplate='<b>%{y}</b><br>Mentions: %{x}<extra></extra>',
                 name=selected_sentiment
+            ),
+            layout=dict(
+                title=dict(text=f"Top Complained Aspects - {selected_sentiment} Sentiment"),
+                xaxis=dict(
+                    title=dict(text="Number of Mentions", font=dict(color=colors['text'])),
+                    gridcolor=colors['grid'],
+                    tickfont=dict(color=colors['text'])
+                ),
+                yaxis=dict(
+                    title=dict(text="Aspect", font=dict(color=colors['text'])),
+                    tickfont=dict(color=colors['text'])
+                ),
+                height=500,
+                showlegend=False,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor=colors['plot_bg'],
+                font=dict(color=colors['text']),
+                margin=dict(l=200)
             )
         )
         
-        fig.update_layout(
-            title=f"Top Complained Aspects - {selected_sentiment} Sentiment",
-            xaxis_title="Number of Mentions",
-            yaxis_title="Aspect",
-            height=500,
-            showlegend=False,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor=colors['plot_bg'],
-            xaxis_gridcolor=colors['grid'],
-            xaxis_title_font_color=colors['text'],
-            yaxis_title_font_color=colors['text'],
-            xaxis_tickfont_color=colors['text'],
-            yaxis_tickfont_color=colors['text'],
-            font_color=colors['text'],
-            margin=dict(l=200)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="aspects_top_bar")
     else:
         st.warning("No data available for the selected sentiment.")
     
@@ -1680,7 +1881,7 @@ def page_aspects(topic_keywords):
     
     if len(filtered_df) > 0:
         # Dropdown to select aspect
-        available_aspects = sorted(filtered_df['Aspect'].unique())
+        available_aspects = sorted(aspect_vc.index)
         selected_aspect = st.selectbox(
             "Select Aspect to View Details:",
             available_aspects,
@@ -1688,26 +1889,29 @@ def page_aspects(topic_keywords):
         )
         
         # Filter for selected aspect
-        aspect_reviews = filtered_df[filtered_df['Aspect'] == selected_aspect].copy()
+        aspect_reviews = filtered_df[filtered_df['Aspect'] == selected_aspect]
+        
+        # All four tiles come from one array of this aspect's ratings
+        ratings = aspect_reviews['Rating'].to_numpy(dtype='float64')
         
         # Display stats for selected aspect
         aspect_col1, aspect_col2, aspect_col3, aspect_col4 = st.columns(4)
         
         with aspect_col1:
-            st.metric("Reviews", len(aspect_reviews))
+            st.metric("Reviews", len(ratings))
         
         with aspect_col2:
-            avg_rating = aspect_reviews['Rating'].mean()
+            avg_rating = ratings.mean() if len(ratings) > 0 else np.nan
             st.metric("Avg Rating", f"{avg_rating:.1f}★", delta="out of 5")
         
         with aspect_col3:
-            if len(aspect_reviews) > 0:
-                positive_pct = (aspect_reviews['Rating'] >= 4).sum() / len(aspect_reviews) * 100
+            if len(ratings) > 0:
+                positive_pct = (ratings >= 4).mean() * 100
                 st.metric("Positive", f"{positive_pct:.0f}%", delta="(4-5 stars)")
         
         with aspect_col4:
-            if len(aspect_reviews) > 0:
-                negative_pct = (aspect_reviews['Rating'] <= 2).sum() / len(aspect_reviews) * 100
+            if len(ratings) > 0:
+                negative_pct = (ratings <= 2).mean() * 100
                 st.metric("Negative", f"{negative_pct:.0f}%", delta="(1-2 stars)")
         
         st.markdown("---")
@@ -1723,7 +1927,10 @@ def page_aspects(topic_keywords):
             aspect_reviews_sorted = aspect_reviews
 
         # Download button placed above the review list
-        csv_buffer = aspect_reviews_sorted[available_columns].to_csv(index=False)
+        csv_buffer = export_to_csv(
+            aspect_reviews_sorted[available_columns],
+            ('aspect', selected_sentiment, selected_aspect)
+        )
         st.download_button(
             label=f"📥 Download {selected_aspect} Reviews ({len(aspect_reviews)} rows)",
             data=csv_buffer,
@@ -1734,14 +1941,36 @@ def page_aspects(topic_keywords):
         # Display reviews table
         st.markdown(f"#### Review Texts for Aspect: **{selected_aspect}**")
         
-        # Display as expandable cards
-        for idx, (_, row) in enumerate(aspect_reviews_sorted.iterrows()):
-            rating = int(row['Rating']) if pd.notna(row['Rating']) else 'N/A'
+        # One virtualized table instead of an expander per review (thousands for
+        # common aspects); selecting a row opens the full card
+        sentiment_emojis = {'Negative': '🔴', 'Neutral': '🟡', 'Positive': '🟢'}
+        review_table = aspect_reviews_sorted[available_columns]
+        event = st.dataframe(
+            review_table,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            # A new aspect or sentiment is a different table, so it starts unselected
+            key=f"aspect_reviews_{selected_sentiment}_{selected_aspect}",
+            column_config={
+                'Rating': st.column_config.NumberColumn("Rating", format="%d ⭐"),
+                'Review_Text': st.column_config.TextColumn("Review", width="large"),
+                'App_Version': st.column_config.TextColumn("Version")
+            }
+        )
+        
+        # Streamlit can keep a selection that no longer fits the table
+        selected_rows = [i for i in event.selection.rows if i < len(review_table)]
+        if selected_rows:
+            row = review_table.iloc[selected_rows[0]]
+            rating = int(row['Rating']) if pd.notna(row.get('Rating')) else 'N/A'
             sentiment = row.get('Sentiment', 'N/A')
-            sentiment_emoji = {'Negative': '🔴', 'Neutral': '🟡', 'Positive': '🟢'}.get(sentiment, '⚪')
+            sentiment_emoji = sentiment_emojis.get(sentiment, '⚪')
             date_str = str(row.get('Date', 'N/A')).split(' ')[0]
             
-            with st.expander(f"{sentiment_emoji} ⭐ {rating} | {date_str}", expanded=(idx == 0)):
+            with st.container(border=True):
+                st.markdown(f"**{sentiment_emoji} ⭐ {rating} | {date_str}**")
                 st.write(row.get('Review_Text', 'No text'))
                 
                 exp_col1, exp_col2, exp_col3, exp_col4 = st.columns(4)
@@ -1753,8 +1982,10 @@ def page_aspects(topic_keywords):
                     st.caption(f"**Version:** {row.get('App_Version', 'N/A')}")
                 with exp_col4:
                     st.caption(f"**Sentiment:** {sentiment}")
+        else:
+            st.caption("Select a row to read the full review.")
         
-        # Spacer after cards
+        # Spacer after the review table
         st.markdown("---")
     else:
         st.warning("No data available for the selected sentiment.")
@@ -1762,9 +1993,8 @@ def page_aspects(topic_keywords):
 # =============================================================================
 # PAGE: DATA EXPLORER
 # =============================================================================
-def page_explorer(df, topic_keywords):
+def page_explorer(filtered_df, review_text, topic_keywords):
     """Data explorer page with search and filtering"""
-    filtered_df, search_query = setup_sidebar_filters(df, topic_keywords)
     
     st.markdown('<h1 class="main-header">🔍 Data Explorer</h1>', unsafe_allow_html=True)
     
@@ -1797,20 +2027,52 @@ def page_explorer(df, topic_keywords):
     
     sort_col, ascending = sort_map[sort_by]
     if sort_col in filtered_df.columns:
-        display_df = filtered_df.sort_values(by=sort_col, ascending=ascending).head(display_count)
+        # Partial selection of the top rows instead of sorting every review
+        if ascending:
+            display_df = filtered_df.nsmallest(display_count, sort_col)
+        else:
+            display_df = filtered_df.nlargest(display_count, sort_col)
     else:
         display_df = filtered_df.head(display_count)
     
-    # Display reviews
-    for idx, row in display_df.iterrows():
-        topic_display = format_topic_label(row.get('Topic_Label', 'N/A'), topic_keywords) if 'Topic_Label' in row else 'N/A'
+    # Display reviews in one virtualized table; selecting a row opens its details
+    review_columns = ['at', 'ai_sentiment', 'score', 'Topic_Label', 'appVersion', 'content', 'ai_confidence']
+    if review_text is not None:
+        display_df = display_df.assign(content=review_text.loc[display_df.index])
+    review_df = display_df[[col for col in review_columns if col in display_df.columns]].copy()
+    if 'Topic_Label' in review_df.columns:
+        review_df['Topic_Label'] = [format_topic_label(t, topic_keywords) for t in review_df['Topic_Label']]
+    
+    sentiment_emojis = {'Positive': '🟢', 'Negative': '🔴', 'Neutral': '🟡'}
+    
+    event = st.dataframe(
+        review_df,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        # Keyed on the rows shown, so a new sort, count or filter starts unselected
+        key=f"explorer_reviews_{hash(tuple(review_df.index))}",
+        column_config={
+            'at': st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm"),
+            'ai_sentiment': st.column_config.TextColumn("Sentiment"),
+            'score': st.column_config.NumberColumn("Rating", format="%d ⭐"),
+            'Topic_Label': st.column_config.TextColumn("Topic"),
+            'appVersion': st.column_config.TextColumn("Version"),
+            'content': st.column_config.TextColumn("Review", width="large"),
+            'ai_confidence': st.column_config.NumberColumn("Confidence", format="%.2f")
+        }
+    )
+    
+    # Streamlit can keep a selection that no longer fits the table
+    selected_rows = [i for i in event.selection.rows if i < len(review_df)]
+    if selected_rows:
+        row = review_df.iloc[selected_rows[0]]
         sentiment = row.get('ai_sentiment', 'N/A')
-        rating = row.get('score', 'N/A')
+        sentiment_emoji = sentiment_emojis.get(sentiment, '⚪')
         
-        # Color based on sentiment
-        sentiment_emoji = {'Positive': '🟢', 'Negative': '🔴', 'Neutral': '🟡'}.get(sentiment, '⚪')
-        
-        with st.expander(f"{sentiment_emoji} ⭐ {rating} | {topic_display} | {row.get('at', 'N/A')}"):
+        with st.container(border=True):
+            st.markdown(f"**{sentiment_emoji} ⭐ {row.get('score', 'N/A')} | {row.get('Topic_Label', 'N/A')} | {row.get('at', 'N/A')}**")
             st.write(row.get('content', 'No content'))
             
             col1, col2, col3, col4 = st.columns(4)
@@ -1822,21 +2084,24 @@ def page_explorer(df, topic_keywords):
                 st.caption(f"Confidence: {row.get('ai_confidence', 0):.2f}")
             with col4:
                 st.caption(f"Date: {row.get('at', 'N/A')}")
+    else:
+        st.caption("Select a row to read the full review.")
     
     st.markdown("---")
     
     # Stats table
     st.markdown("### 📊 Summary Statistics")
     
+    sentiment_vc = filtered_df['ai_sentiment'].value_counts()
     stats_data = {
         'Metric': ['Total Reviews', 'Avg Rating', 'Avg Sentiment', 'Positive %', 'Negative %', 'Neutral %'],
         'Value': [
             len(filtered_df),
             f"{filtered_df['score'].mean():.2f}" if 'score' in filtered_df.columns else 'N/A',
             f"{filtered_df['sentiment_score'].mean():.3f}" if 'sentiment_score' in filtered_df.columns else 'N/A',
-            f"{len(filtered_df[filtered_df['ai_sentiment']=='Positive'])/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%',
-            f"{len(filtered_df[filtered_df['ai_sentiment']=='Negative'])/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%',
-            f"{len(filtered_df[filtered_df['ai_sentiment']=='Neutral'])/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%'
+            f"{sentiment_vc.get('Positive', 0)/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%',
+            f"{sentiment_vc.get('Negative', 0)/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%',
+            f"{sentiment_vc.get('Neutral', 0)/len(filtered_df)*100:.1f}%" if len(filtered_df) > 0 else '0%'
         ]
     }
     
@@ -1851,6 +2116,8 @@ def load_competitive_data():
     try:
         df = pd.read_csv('competitive_reviews_raw.csv')
         df['at'] = pd.to_datetime(df['at'], errors='coerce')
+        # A handful of brands, grouped and compared on every battleground run
+        df['brand'] = df['brand'].astype('category')
         return df
     except FileNotFoundError:
         return None
@@ -1870,10 +2137,9 @@ def page_market_battleground():
     st.markdown('<h1 class="main-header">⚔️ Market Battleground</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">BPCL vs Competitors: Head-to-Head Analysis</p>', unsafe_allow_html=True)
     
-    # Filter to last 12 months
-    comp_data['at'] = pd.to_datetime(comp_data['at'], errors='coerce')
+    # Filter to last 12 months ('at' is parsed once in load_competitive_data)
     cutoff_date = pd.Timestamp.now() - pd.DateOffset(months=12)
-    comp_filtered = comp_data[comp_data['at'] >= cutoff_date].copy()
+    comp_filtered = comp_data[comp_data['at'] >= cutoff_date]
     
     # =========================================================================
     # ROW 1: KEY METRICS
@@ -1882,15 +2148,12 @@ def page_market_battleground():
     
     # Calculate NSS for each brand
     def calc_nss_per_brand(df):
-        nss_dict = {}
-        for brand in df['brand'].unique():
-            brand_data = df[df['brand'] == brand]
-            promoters = len(brand_data[brand_data['score'] == 5])
-            detractors = len(brand_data[brand_data['score'] <= 3])
-            total = len(brand_data)
-            nss = ((promoters - detractors) / total * 100) if total > 0 else 0
-            nss_dict[brand] = nss
-        return nss_dict
+        # Promoter/detractor flags summed per brand in a single groupby pass
+        flags = pd.DataFrame({'promoters': df['score'] == 5, 'detractors': df['score'] <= 3})
+        grouped = flags.groupby(df['brand'], sort=False, observed=True)
+        counts = grouped.sum()
+        nss = (counts['promoters'] - counts['detractors']) / grouped.size() * 100
+        return nss.to_dict()
     
     nss_scores = calc_nss_per_brand(comp_filtered)
     
@@ -1956,27 +2219,26 @@ def page_market_battleground():
         complaint_topics = ['Login', 'Payment', 'UI', 'Support']
         brands = comp_filtered['brand'].unique()
         
-        # Simple complaint count matrix
-        complaint_matrix = []
-        for brand in brands:
-            brand_data = comp_filtered[(comp_filtered['brand'] == brand) & (comp_filtered['score'] <= 2)]
-            row = {'Brand': brand}
-            for topic in complaint_topics:
-                keywords = {
-                    'Login': ['login', 'otp', 'verify', 'sms'],
-                    'Payment': ['payment', 'fail', 'money', 'deduct'],
-                    'UI': ['slow', 'crash', 'hang', 'freeze'],
-                    'Support': ['support', 'help', 'ticket', 'contact']
-                }
-                count = 0
-                if len(brand_data) > 0:
-                    for keyword in keywords.get(topic, []):
-                        count += brand_data['content'].fillna('').str.lower().str.contains(keyword).sum()
-                rate = (count / len(comp_filtered[comp_filtered['brand'] == brand]) * 100) if len(comp_filtered[comp_filtered['brand'] == brand]) > 0 else 0
-                row[topic] = rate
-            complaint_matrix.append(row)
-        
-        df_complaints = pd.DataFrame(complaint_matrix).set_index('Brand')
+        # Keyword hits per low-rated review, tallied per brand in one groupby
+        complaint_keywords = {
+            'Login': ['login', 'otp', 'verify', 'sms'],
+            'Payment': ['payment', 'fail', 'money', 'deduct'],
+            'UI': ['slow', 'crash', 'hang', 'freeze'],
+            'Support': ['support', 'help', 'ticket', 'contact']
+        }
+        low_rated = comp_filtered[comp_filtered['score'] <= 2]
+        content_lower = low_rated['content'].fillna('').str.lower()
+        keyword_hits = pd.DataFrame({
+            topic: sum(content_lower.str.contains(keyword, regex=False).astype(int) for keyword in keywords)
+            for topic, keywords in complaint_keywords.items()
+        })
+        brand_totals = comp_filtered['brand'].value_counts().reindex(brands)
+        df_complaints = (
+            keyword_hits.groupby(low_rated['brand'], observed=True).sum()
+            .reindex(index=brands, columns=complaint_topics, fill_value=0)
+            .div(brand_totals, axis=0) * 100
+        )
+        df_complaints.index.name = 'Brand'
         
         fig_heatmap = px.imshow(
             df_complaints,
@@ -1991,14 +2253,17 @@ def page_market_battleground():
             paper_bgcolor='rgba(0,0,0,0)',
             font=dict(color=colors['text'])
         )
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(fig_heatmap, use_container_width=True, key="battleground_complaint_heatmap")
     
     with col_right:
         st.markdown("#### 📢 Share of Voice (Review Velocity)")
         st.info("💡 Track engagement: Higher volume = stronger market presence")
         
         # Aggregate reviews by brand and date
-        reviews_by_date = comp_filtered.groupby([pd.Grouper(key='at', freq='W'), 'brand']).size().reset_index(name='count')
+        # Roll each date forward to its week-ending Sunday (the same bins and
+        # labels as pd.Grouper(freq='W')) and group on the plain column
+        week_end = (comp_filtered['at'].dt.normalize() + pd.offsets.Week(weekday=6, n=0)).rename('at')
+        reviews_by_date = comp_filtered.groupby([week_end, 'brand'], observed=True).size().reset_index(name='count')
         
         fig_sov = px.line(
             reviews_by_date,
@@ -2015,7 +2280,7 @@ def page_market_battleground():
             font=dict(color=colors['text']),
             hovermode='x unified'
         )
-        st.plotly_chart(fig_sov, use_container_width=True)
+        st.plotly_chart(fig_sov, use_container_width=True, key="battleground_share_of_voice")
     
     st.markdown("---")
     
@@ -2062,8 +2327,9 @@ def page_strategic_deep_dive():
 # =============================================================================
 def main():
     # Load data
-    df = load_data()
-    cm_data = load_confusion_matrix()
+    signature = data_file_signature()
+    df = load_data(signature)
+    review_text = load_review_text(signature)
     topic_keywords = load_topic_keywords()
     
     if df is None:
@@ -2088,17 +2354,21 @@ def main():
                                label_visibility="collapsed",
                                key="internal_pulse_nav")
         
+        # Filter once per run; the Aspects page uses its own dataset
+        if page != "🎯 Aspects":
+            filtered_df = setup_sidebar_filters(df, review_text, signature, topic_keywords)
+        
         # Route to page
         if page == "📊 Overview":
-            page_overview(df, topic_keywords)
+            page_overview(df, filtered_df, topic_keywords)
         elif page == "🏷️ Topics":
-            page_topics(df, topic_keywords)
+            page_topics(filtered_df, topic_keywords)
         elif page == "😊 Sentiment":
-            page_sentiment(df, topic_keywords)
+            page_sentiment(filtered_df, topic_keywords)
         elif page == "🎯 Aspects":
             page_aspects(topic_keywords)
         elif page == "🔍 Explorer":
-            page_explorer(df, topic_keywords)
+            page_explorer(filtered_df, review_text, topic_keywords)
     
     # =========================================================================
     # TAB 2: MARKET BATTLEGROUND (Competitive Module)
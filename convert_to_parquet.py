@@ -0,0 +1,28 @@
+"""
+Convert df_final_enriched.csv to Parquet for faster dashboard loading
+"""
+
+import pandas as pd
+
+def convert_csv_to_parquet(csv_file, parquet_file):
+    """Convert the enriched review CSV to a typed Parquet file"""
+    df = pd.read_csv(csv_file)
+
+    # Store parsed dates so the dashboard does not re-parse them on load
+    if 'at' in df.columns:
+        df['at'] = pd.to_datetime(df['at'], errors='coerce')
+
+    for col in ('ai_sentiment', 'Topic_Label', 'appVersion'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+    print(f"✅ Successfully converted to: {parquet_file} ({len(df):,} rows)")
+
+if __name__ == "__main__":
+    csv_file = "df_final_enriched.csv"
+    parquet_file = "df_final_enriched.parquet"
+
+    print("Converting CSV to Parquet...")
+    convert_csv_to_parquet(csv_file, parquet_file)
+    print("Done!")
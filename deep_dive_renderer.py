@@ -227,19 +227,21 @@ def render_deep_dive_tab() -> None:
             with col1:
                 st.write("**BPCL Personas:**")
                 bpcl_personas = personas_df[personas_df['Brand'] == 'BPCL']
-                for _, row in bpcl_personas.iterrows():
+                persona_rows = bpcl_personas[['Persona', 'Avg_Rating', 'Share_of_Voice_%']]
+                for persona, avg_rating, share in persona_rows.itertuples(index=False):
                     st.caption(
-                        f"  • {row['Persona']}: {row['Avg_Rating']:.2f}⭐ "
-                        f"({row['Share_of_Voice_%']:.1f}% of base)"
+                        f"  • {persona}: {avg_rating:.2f}⭐ "
+                        f"({share:.1f}% of base)"
                     )
             
             with col2:
                 st.write("**IOCL Personas:**")
                 iocl_personas = personas_df[personas_df['Brand'] == 'IOCL']
-                for _, row in iocl_personas.iterrows():
+                persona_rows = iocl_personas[['Persona', 'Avg_Rating', 'Share_of_Voice_%']]
+                for persona, avg_rating, share in persona_rows.itertuples(index=False):
                     st.caption(
-                        f"  • {row['Persona']}: {row['Avg_Rating']:.2f}⭐ "
-                        f"({row['Share_of_Voice_%']:.1f}% of base)"
+                        f"  • {persona}: {avg_rating:.2f}⭐ "
+                        f"({share:.1f}% of base)"
                     )
             
         except Exception as e: